@@ -0,0 +1,263 @@
+"""Offline batch runner for script QA and document summarization.
+
+Reads items from JSONL, shares one loaded index and one LLM gateway across
+worker threads, and streams results to a JSONL output file. The output
+doubles as the checkpoint: rerunning the same command skips every item
+already answered successfully and retries the rest.
+
+    # Hundreds of questions over a script
+    python batch/run_batch.py qa --input questions.jsonl --output answers.jsonl
+
+    # A whole folder of PDFs overnight
+    python batch/run_batch.py summarize --folder reviews/ --output summaries.jsonl
+
+Input lines look like {"id": "q1", "question": "..."} for ``qa`` and
+{"id": "doc1", "path": "report.pdf", "strategy": "Refine"} for ``summarize``.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from dotenv import load_dotenv
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.append(REPO_DIR)
+
+DEFAULT_PDF = os.path.join(REPO_DIR, "task-03-RAG-Q", "A", "data", "Jathi_rathanalu_censor_script_telugu.pdf")
+
+
+# --------------------------
+# 1️⃣ Items and checkpoint
+# --------------------------
+def read_items(args):
+    if args.folder:
+        names = sorted(n for n in os.listdir(args.folder) if n.lower().endswith((".pdf", ".txt")))
+        return [{"id": n, "path": os.path.join(args.folder, n)} for n in names]
+    items = []
+    with open(args.input, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if line.strip():
+                item = json.loads(line)
+                item.setdefault("id", str(line_no))
+                items.append(item)
+    return items
+
+
+def completed_ids(output_path):
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partial line from an interrupted run
+            # The last record of an item wins
+            if record.get("status") == "ok":
+                done.add(str(record["id"]))
+            else:
+                done.discard(str(record["id"]))
+    return done
+
+
+def open_output(output_path):
+    """Open the results file for appending, on a fresh line if an interrupted run left a partial one."""
+    partial = False
+    if os.path.exists(output_path) and os.path.getsize(output_path):
+        with open(output_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            partial = f.read(1) != b"\n"
+    out = open(output_path, "a", encoding="utf-8")
+    if partial:
+        out.write("\n")
+    return out
+
+
+# --------------------------
+# 2️⃣ Shared LLM gateway
+# --------------------------
+def make_gateway(args):
+    from common.gateway import LLMGateway
+
+    if args.stub_llm:
+        from common.stub_llm import StubChatModel
+
+        llm = StubChatModel()
+    else:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        load_dotenv()
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("⚠️ Please set GEMINI_API_KEY in your .env file")
+        llm = ChatGoogleGenerativeAI(
+            model="models/gemini-pro-latest",
+            google_api_key=api_key,
+            temperature=0.2,
+            max_retries=0,  # the gateway owns the retry policy
+        )
+    return LLMGateway(llm=llm, max_concurrency=args.llm_concurrency, max_retries=args.retries)
+
+
+# --------------------------
+# 3️⃣ Pipelines (built once, shared by all workers)
+# --------------------------
+def index_manifest(pdf_path):
+    # Everything that changes the index contents; a saved index is reused only if all match
+    from common.chunking import EMBEDDING_MODEL, RAG_CHUNK_OVERLAP, RAG_CHUNK_TOKENS
+
+    return {
+        "pdf": os.path.abspath(pdf_path),
+        "pdf_mtime": os.path.getmtime(pdf_path),
+        "embedding_model": EMBEDDING_MODEL,
+        "chunk_tokens": RAG_CHUNK_TOKENS,
+        "chunk_overlap": RAG_CHUNK_OVERLAP,
+    }
+
+
+def saved_index_matches(index_dir, manifest):
+    manifest_path = os.path.join(index_dir, "manifest.json")
+    if not (os.path.exists(os.path.join(index_dir, "index.faiss")) and os.path.exists(manifest_path)):
+        return False
+    with open(manifest_path, encoding="utf-8") as f:
+        return json.load(f) == manifest
+
+
+def build_qa(args, llm):
+    from langchain.chains import RetrievalQA
+    from langchain_community.document_loaders import PyPDFLoader
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    from langchain_community.vectorstores import FAISS
+    from common.chunking import EMBEDDING_MODEL, rag_splitter
+    from common.rerank import rerank_retriever
+
+    embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+    manifest = index_manifest(args.pdf)
+    if args.index_dir and saved_index_matches(args.index_dir, manifest):
+        print("🗂️ Loading FAISS index from", args.index_dir)
+        vectorstore = FAISS.load_local(args.index_dir, embeddings, allow_dangerous_deserialization=True)
+    else:
+        print("🗂️ Building FAISS index for", args.pdf)
+        docs = PyPDFLoader(args.pdf).load()
+        vectorstore = FAISS.from_documents(rag_splitter().split_documents(docs), embeddings)
+        if args.index_dir:
+            vectorstore.save_local(args.index_dir)
+            with open(os.path.join(args.index_dir, "manifest.json"), "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+
+    retriever = rerank_retriever(vectorstore) if args.rerank else vectorstore.as_retriever()
+    qa = RetrievalQA.from_chain_type(llm=llm, retriever=retriever, return_source_documents=True)
+
+    def run(item):
+        result = qa.invoke({"query": item["question"]})
+        pages = sorted({d.metadata.get("page") for d in result["source_documents"] if "page" in d.metadata})
+        return {"question": item["question"], "answer": result["result"], "source_pages": pages}
+
+    return run
+
+
+def extract_text(path):
+    # Same extraction as task-06-summarization/summarizer.py
+    if path.lower().endswith(".pdf"):
+        import PyPDF2
+
+        with open(path, "rb") as f:
+            reader = PyPDF2.PdfReader(f)
+            return "\n".join(page.extract_text() for page in reader.pages if page.extract_text())
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def build_summarize(args, llm):
+    from langchain.chains.summarize import load_summarize_chain
+    from langchain.docstore.document import Document
+    from common.chunking import summary_splitter
+
+    splitter = summary_splitter()
+    chains = {
+        "MapReduce": load_summarize_chain(llm, chain_type="map_reduce"),
+        "Refine": load_summarize_chain(llm, chain_type="refine"),
+    }
+
+    def run(item):
+        strategy = item.get("strategy", args.strategy)
+        chunks = splitter.split_documents([Document(page_content=extract_text(item["path"]))])
+        summary = chains[strategy].invoke({"input_documents": chunks})["output_text"]
+        return {"path": item["path"], "strategy": strategy, "chunks": len(chunks), "summary": summary}
+
+    return run
+
+
+# --------------------------
+# 4️⃣ Runner
+# --------------------------
+def process(run, item):
+    t0 = time.perf_counter()
+    try:
+        record = {"id": str(item["id"]), "status": "ok", **run(item)}
+    except Exception as e:
+        record = {"id": str(item["id"]), "status": "failed", "error": f"{type(e).__name__}: {e}"}
+    record["latency_s"] = round(time.perf_counter() - t0, 3)
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch QA and summarization with checkpointing.")
+    parser.add_argument("mode", choices=["qa", "summarize"])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="JSONL file of questions (qa) or files (summarize)")
+    source.add_argument("--folder", help="Summarize every PDF/TXT file in this folder")
+    parser.add_argument("--output", required=True, help="JSONL results file, also used to resume")
+    parser.add_argument("--workers", type=int, default=4, help="Items processed concurrently")
+    parser.add_argument("--llm-concurrency", type=int, default=4, help="Max in-flight LLM requests")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per LLM call")
+    parser.add_argument("--pdf", default=DEFAULT_PDF, help="Script to index for qa")
+    parser.add_argument("--index-dir", help="Save/load the FAISS index here to skip re-embedding on resume")
+    parser.add_argument("--rerank", action="store_true", help="Rerank retrieval with the cached cross-encoder")
+    parser.add_argument("--strategy", choices=["MapReduce", "Refine"], default="MapReduce")
+    parser.add_argument("--stub-llm", action="store_true", help="Use the offline stub LLM (dry run)")
+    args = parser.parse_args()
+    if args.folder and args.mode != "summarize":
+        parser.error("--folder is only supported for summarize")
+
+    items = read_items(args)
+    done = completed_ids(args.output)
+    pending = [item for item in items if str(item["id"]) not in done]
+    print(f"📋 {len(items)} items, {len(items) - len(pending)} already done, {len(pending)} to run")
+    if not pending:
+        return
+
+    llm = make_gateway(args)
+    run = build_qa(args, llm) if args.mode == "qa" else build_summarize(args, llm)
+
+    ok = failed = 0
+    start = time.perf_counter()
+    with open_output(args.output) as out, ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(process, run, item) for item in pending]
+        for n, future in enumerate(as_completed(futures), 1):
+            record = future.result()
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            if record["status"] == "ok":
+                ok += 1
+            else:
+                failed += 1
+                print(f"⚠️ {record['id']}: {record['error']}")
+            if n % 10 == 0 or n == len(pending):
+                rate = n / (time.perf_counter() - start)
+                print(f"⏱️ {n}/{len(pending)} done | {rate:.2f} items/s | {failed} failed")
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ {ok} ok, {failed} failed in {elapsed:.1f}s ({len(pending) / elapsed:.2f} items/s)")
+    print(f"   LLM calls {llm.calls}, retries {llm.retries}, failed calls {llm.failures}")
+    if failed:
+        print("   Rerun the same command to retry failed items.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare the old fixed 1000-character splitting with the token-aware chunker.
+
+Runs both on the bundled Jathi Ratnalu PDF and reports chunk counts, token
+sizes, embedding time and the number of summary LLM calls.
+
+    python benchmarks/chunking_report.py --output benchmarks/chunking_report.json
+"""
+import time
+
+from run_benchmarks import (
+    load_pdf_docs, load_summary_text, make_embeddings, make_llm, make_token_counter, report_config, report_parser, write_report,
+)
+
+from langchain.chains.summarize import load_summarize_chain
+from langchain.docstore.document import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from common.chunking import DEFAULT_TOKENIZER, rag_splitter, summary_splitter, token_counter
+
+# all-MiniLM-L6-v2 embeds at most 256 tokens per chunk
+EMBEDDING_MAX_TOKENS = 256
+
+SPLITTERS = {
+    "chars_1000": {
+        "rag": lambda count: RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200),
+        "summary": lambda count: RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100),
+    },
+    "tokens": {
+        "rag": rag_splitter,
+        "summary": summary_splitter,
+    },
+}
+
+
+def rag_report(splitter, docs, embeddings, count):
+    t0 = time.perf_counter()
+    chunks = splitter.split_documents(docs)
+    split_s = time.perf_counter() - t0
+
+    texts = [c.page_content for c in chunks]
+    t0 = time.perf_counter()
+    embeddings.embed_documents(texts)
+    embed_s = time.perf_counter() - t0
+
+    sizes = [count(t) for t in texts]
+    return {
+        "chunks": len(chunks),
+        "mean_tokens": round(sum(sizes) / len(sizes), 1),
+        "truncated_chunks": sum(1 for n in sizes if n > EMBEDDING_MAX_TOKENS),
+        "split_s": round(split_s, 3),
+        "embedding_s": round(embed_s, 3),
+    }
+
+
+def summary_report(splitter, text, config):
+    chunks = splitter.split_documents([Document(page_content=text)])
+    report = {"chunks": len(chunks)}
+    for chain_type in ("map_reduce", "refine"):
+        llm = make_llm(config)
+        load_summarize_chain(llm, chain_type=chain_type).invoke({"input_documents": chunks})
+        report[f"{chain_type}_llm_calls"] = llm.calls
+        report[f"{chain_type}_prompt_tokens"] = llm.prompt_tokens
+    return report
+
+
+def main():
+    # Only LLM call counts matter here, so no simulated prompt latency by default
+    args = report_parser("Before/after report for the token-aware chunker.", ms_per_1k_tokens=0.0).parse_args()
+
+    config = report_config(args)
+    docs = load_pdf_docs()
+    text = load_summary_text()
+    embeddings = make_embeddings(config)
+    # --embeddings hash stays offline: sizes are then the ~4 characters per token estimate
+    approx = make_token_counter(config)
+    count = approx or token_counter(DEFAULT_TOKENIZER)
+
+    report = {}
+    for name, factories in SPLITTERS.items():
+        print(f"✂️ {name}...")
+        report[name] = {
+            "rag": rag_report(factories["rag"](approx), docs, embeddings, count),
+            "summary": summary_report(factories["summary"](approx), text, config),
+        }
+
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare plain top-k retrieval with cross-encoder reranking on the fixed question set.
+
+For each mode it reports retrieval latency (cold and warm score cache),
+prompt tokens sent to the LLM, simulated LLM latency (proportional to
+prompt size) and the share of questions whose context contains an
+expected keyword, as a proxy for answer quality.
+
+    python benchmarks/rerank_report.py --ms-per-1k-tokens 400
+"""
+import time
+
+from run_benchmarks import QA_SET, build_vectorstore, make_llm, report_config, report_parser, write_report
+
+from langchain.chains import RetrievalQA
+
+from common.rerank import CachedCrossEncoderReranker, rerank_retriever
+
+
+def context_hit(docs, expect):
+    context = "\n".join(d.page_content for d in docs).lower()
+    return any(keyword.lower() in context for keyword in expect)
+
+
+def run_mode(retriever, config, passes):
+    llm = make_llm(config)
+    qa = RetrievalQA.from_chain_type(llm=llm, retriever=retriever)
+
+    retrieval_ms = []
+    llm_ms = []
+    hits = 0
+    for pass_no in range(passes):
+        pass_ms = []
+        for item in QA_SET:
+            t0 = time.perf_counter()
+            docs = retriever.invoke(item["question"])
+            pass_ms.append((time.perf_counter() - t0) * 1000)
+
+            t0 = time.perf_counter()
+            qa.combine_documents_chain.invoke({"input_documents": docs, "question": item["question"]})
+            llm_ms.append((time.perf_counter() - t0) * 1000)
+
+            if pass_no == 0:
+                hits += context_hit(docs, item["expect"])
+        retrieval_ms.append(round(sum(pass_ms) / len(pass_ms), 2))
+
+    calls = len(QA_SET) * passes
+    return {
+        "retrieval_ms_by_pass": retrieval_ms,
+        "prompt_tokens_per_question": round(llm.prompt_tokens / calls, 1),
+        "llm_ms_per_question": round(sum(llm_ms) / len(llm_ms), 2),
+        "context_hit_rate": round(hits / len(QA_SET), 3),
+    }
+
+
+def main():
+    parser = report_parser("Before/after report for cross-encoder reranking.")
+    parser.add_argument("--passes", type=int, default=2, help="Passes over the question set (later passes hit the cache)")
+    args = parser.parse_args()
+
+    config = report_config(args)
+    vectorstore = build_vectorstore(config)
+
+    # Load the model before timing so the first pass only measures the cold score cache
+    reranker = CachedCrossEncoderReranker()
+    reranker.warm_up()
+
+    report = {}
+    for name, retriever in [("top_k", vectorstore.as_retriever()), ("rerank", rerank_retriever(vectorstore, reranker=reranker))]:
+        print(f"🎯 {name}...")
+        report[name] = run_mode(retriever, config, args.passes)
+
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
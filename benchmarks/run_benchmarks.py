@@ -0,0 +1,527 @@
+"""Offline benchmark suite for every task pipeline.
+
+Each pipeline is rebuilt the way its task script builds it, but with
+``StubChatModel`` in place of Gemini and a local embedding model, so runs
+are deterministic and need no API key. Every benchmark runs in its own
+process so peak RSS is reported per pipeline.
+
+    python benchmarks/run_benchmarks.py --output benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --compare benchmarks/baseline.json
+
+The before/after report scripts next to this file import their pipeline
+builders and CLI helpers from here, which also puts the repo root on
+``sys.path`` for ``common``.
+"""
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BASE_DIR)
+sys.path.append(REPO_DIR)
+
+PDF_PATH = os.path.join(REPO_DIR, "task-03-RAG-Q", "A", "data", "Jathi_rathanalu_censor_script_telugu.pdf")
+SUMMARY_PDF_PATH = os.path.join(REPO_DIR, "task-06-summarization", "data", "Jathi_rathanalu_censor_script_telugu.pdf")
+
+# Fixed question set: {"question": ..., "expect": [keywords a good context should contain]}
+QA_QUESTIONS_PATH = os.path.join(BASE_DIR, "data", "qa_questions.jsonl")
+with open(QA_QUESTIONS_PATH, encoding="utf-8") as f:
+    QA_SET = [json.loads(line) for line in f if line.strip()]
+QA_QUESTIONS = [item["question"] for item in QA_SET]
+
+AGENT_QUERIES = [
+    "Ticket timings for Avatar",
+    "Box office prediction for Jawan this weekend",
+    "Who directed Titanic?",
+    "Plot of Inception",
+    "Budget of Avatar",
+    "Recommend me a restaurant",
+]
+
+SQL_QUESTIONS = [
+    "Top 5 products by revenue",
+    "How many customers are in each region?",
+    "What is the average order value?",
+    "Total quantity sold per category",
+    "Which customers placed the most orders?",
+]
+
+SQL_RESPONSES = {
+    "revenue": "SELECT p.name, SUM(o.total_price) AS revenue FROM orders o JOIN products p ON p.id = o.product_id GROUP BY p.name ORDER BY revenue DESC LIMIT 5;",
+    "region": "SELECT region, COUNT(*) FROM customers GROUP BY region;",
+    "average order": "SELECT AVG(total_price) FROM orders;",
+    "category": "SELECT p.category, SUM(o.quantity) FROM orders o JOIN products p ON p.id = o.product_id GROUP BY p.category;",
+    "most orders": "SELECT c.name, COUNT(*) AS n FROM orders o JOIN customers c ON c.id = o.customer_id GROUP BY c.name ORDER BY n DESC LIMIT 5;",
+}
+
+SQL_PROMPT = """
+You are a helpful data analyst. Given the table schema and a user question, write a safe SQL query to answer it.
+
+Schema:
+{table_info}
+
+Question:
+{input}
+
+Only use columns that exist. Limit results to {top_k} rows if applicable.
+"""
+
+
+# --------------------------
+# 1️⃣ Shared helpers
+# --------------------------
+def percentile(values, pct):
+    ordered = sorted(values)
+    k = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[k]
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def timed(fn, inputs, repeats):
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for item in inputs:
+            t0 = time.perf_counter()
+            fn(item)
+            latencies.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - start
+    return latencies, wall
+
+
+def summarize_latencies(latencies, wall):
+    ms = [x * 1000 for x in latencies]
+    return {
+        "ops": len(ms),
+        "throughput_ops_s": round(len(ms) / wall, 3) if wall else None,
+        "latency_ms": {
+            "mean": round(sum(ms) / len(ms), 3),
+            "p50": round(percentile(ms, 50), 3),
+            "p95": round(percentile(ms, 95), 3),
+            "p99": round(percentile(ms, 99), 3),
+            "max": round(max(ms), 3),
+        },
+    }
+
+
+def make_llm(config):
+    from common.stub_llm import StubChatModel
+
+    return StubChatModel(
+        sql_responses=SQL_RESPONSES,
+        base_latency=config.get("llm_latency_ms", 0.0) / 1000,
+        # Simulated prompt processing time, so prompt size shows up as latency
+        latency_per_token=config.get("ms_per_1k_tokens", 0.0) / 1_000_000,
+    )
+
+
+def make_token_counter(config):
+    """``None`` (the real tokenizers) unless the run must stay offline, then ~4 characters per token."""
+    if config["embeddings"] == "hash":
+        from common.stub_llm import approx_tokens
+
+        return approx_tokens
+    return None
+
+
+def make_embeddings(config):
+    if config["embeddings"] == "hash":
+        from langchain_community.embeddings import DeterministicFakeEmbedding
+
+        return DeterministicFakeEmbedding(size=384)
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+    from common.chunking import EMBEDDING_MODEL
+
+    return HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+
+
+def load_pdf_docs():
+    from langchain_community.document_loaders import PyPDFLoader
+
+    return PyPDFLoader(PDF_PATH).load()
+
+
+def split_docs(docs, config):
+    from common.chunking import rag_splitter
+
+    return rag_splitter(make_token_counter(config)).split_documents(docs)
+
+
+def make_retriever(vectorstore, config):
+    if config.get("rerank"):
+        from common.rerank import rerank_retriever
+
+        return rerank_retriever(vectorstore)
+    return vectorstore.as_retriever()
+
+
+def build_vectorstore(config):
+    from langchain_community.vectorstores import FAISS
+
+    chunks = split_docs(load_pdf_docs(), config)
+    return FAISS.from_documents(chunks, make_embeddings(config))
+
+
+def report_parser(description, ms_per_1k_tokens=400.0):
+    """Common CLI for the before/after report scripts."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--embeddings", choices=["minilm", "hash"], default="minilm")
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=ms_per_1k_tokens,
+                        help="Simulated LLM prompt processing time")
+    parser.add_argument("--output", help="Optional JSON file for the report")
+    return parser
+
+
+def report_config(args):
+    return {"embeddings": args.embeddings, "llm_latency_ms": 0.0, "ms_per_1k_tokens": args.ms_per_1k_tokens}
+
+
+def print_report(report, indent=0):
+    for key, value in report.items():
+        if isinstance(value, dict):
+            print("   " * indent + str(key))
+            print_report(value, indent + 1)
+        else:
+            print("   " * indent + f"{key:32}{value}")
+
+
+def write_report(report, output):
+    print()
+    print_report(report)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Report written to {output}")
+
+
+# --------------------------
+# 2️⃣ Benchmarks (mirror the task scripts)
+# --------------------------
+def bench_index_build(config):
+    from langchain_community.vectorstores import FAISS
+
+    docs = load_pdf_docs()
+    embeddings = make_embeddings(config)
+    chunk_counts = []
+
+    def build(_):
+        chunks = split_docs(docs, config)
+        chunk_counts.append(len(chunks))
+        FAISS.from_documents(chunks, embeddings)
+
+    latencies, wall = timed(build, [None], config["repeats"])
+    result = summarize_latencies(latencies, wall)
+    result["extra"] = {
+        "pages": len(docs),
+        "chunks": chunk_counts[-1],
+        "chunks_per_s": round(sum(chunk_counts) / wall, 3),
+    }
+    return result
+
+
+def bench_retrieval(config):
+    retriever = make_retriever(build_vectorstore(config), config)
+    latencies, wall = timed(retriever.invoke, QA_QUESTIONS, config["repeats"])
+    return summarize_latencies(latencies, wall)
+
+
+def bench_qa(config):
+    from langchain.chains import RetrievalQA
+
+    llm = make_llm(config)
+    qa = RetrievalQA.from_chain_type(
+        llm=llm,
+        retriever=make_retriever(build_vectorstore(config), config),
+        return_source_documents=True,
+    )
+    latencies, wall = timed(lambda q: qa.invoke({"query": q}), QA_QUESTIONS, config["repeats"])
+    result = summarize_latencies(latencies, wall)
+    result["extra"] = {"llm_calls": llm.calls, "prompt_tokens": llm.prompt_tokens}
+    return result
+
+
+def create_ecommerce_db(db_file, extra_tables=0):
+    # Same schema and data shape as task-05-SQL-Q/A-agent/sql_qa_agent.py, seeded for repeatability.
+    # extra_tables adds unrelated tables to show how prompts grow with the schema.
+    rng = random.Random(42)
+    conn = sqlite3.connect(db_file)
+    conn.executescript("""
+    CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT, age INTEGER, email TEXT, region TEXT);
+    CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, category TEXT, price REAL, rating REAL);
+    CREATE TABLE orders (
+        id INTEGER PRIMARY KEY, customer_id INTEGER, product_id INTEGER, quantity INTEGER,
+        order_date TEXT, total_price REAL,
+        FOREIGN KEY(customer_id) REFERENCES customers(id),
+        FOREIGN KEY(product_id) REFERENCES products(id)
+    );
+    """)
+    regions = ['North', 'South', 'East', 'West']
+    categories = ['Electronics', 'Home Appliances', 'Furniture', 'Footwear', 'Accessories', 'Clothing']
+    conn.executemany('INSERT INTO customers VALUES (?, ?, ?, ?, ?)', [
+        (i, f'Customer{i}', rng.randint(18, 60), f'customer{i}@email.com', rng.choice(regions))
+        for i in range(1, 51)
+    ])
+    products = [
+        (i, f'Product{i}', categories[i % len(categories)], float(rng.randint(20, 800)), round(rng.uniform(4.0, 4.7), 1))
+        for i in range(1, 21)
+    ]
+    conn.executemany('INSERT INTO products VALUES (?, ?, ?, ?, ?)', products)
+    start_date = datetime(2025, 1, 1)
+    orders = []
+    for order_id in range(1, 151):
+        product = products[rng.randint(0, 19)]
+        quantity = rng.randint(1, 3)
+        order_date = start_date + timedelta(days=rng.randint(0, 60))
+        orders.append((order_id, rng.randint(1, 50), product[0], quantity, order_date.strftime('%Y-%m-%d'), product[3] * quantity))
+    conn.executemany('INSERT INTO orders VALUES (?, ?, ?, ?, ?, ?)', orders)
+    for t in range(extra_tables):
+        conn.execute(f'CREATE TABLE warehouse_log_{t} (id INTEGER PRIMARY KEY, sku TEXT, shelf TEXT, moved_at TEXT, note TEXT)')
+        conn.executemany(f'INSERT INTO warehouse_log_{t} VALUES (?, ?, ?, ?, ?)', [
+            (i, f'SKU{rng.randint(1000, 9999)}', f'S{rng.randint(1, 40)}', '2025-01-01', 'restocked')
+            for i in range(1, 6)
+        ])
+    conn.commit()
+    conn.close()
+
+
+def bench_sql(config):
+    import re
+    from langchain.prompts import PromptTemplate
+    from langchain_experimental.sql import SQLDatabaseChain
+    from common.schema_catalog import CatalogSQLDatabase, SchemaCatalog
+
+    llm = make_llm(config)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = os.path.join(tmp, "ecommerce.db")
+        create_ecommerce_db(db_file)
+        catalog = SchemaCatalog(db_file, embeddings=make_embeddings(config))
+        db = CatalogSQLDatabase.from_uri(f"sqlite:///{db_file}", catalog=catalog)
+        prompt = PromptTemplate(input_variables=["input", "table_info", "top_k"], template=SQL_PROMPT)
+        sql_chain = SQLDatabaseChain.from_llm(llm=llm, db=db, prompt=prompt, return_intermediate_steps=True)
+
+        def answer(question):
+            result = sql_chain.invoke({"query": question, "table_names_to_use": catalog.select(question)})
+            raw_sql = result["intermediate_steps"][2]["sql_cmd"]
+            if raw_sql not in SQL_RESPONSES.values():
+                raise RuntimeError(f"Stub LLM returned no canned query for {question!r}: {raw_sql}")
+            db.run(re.sub(r"```sql|```", "", raw_sql).strip())
+
+        latencies, wall = timed(answer, SQL_QUESTIONS, config["repeats"])
+        db._engine.dispose()
+    result = summarize_latencies(latencies, wall)
+    result["extra"] = {"llm_calls": llm.calls, "prompt_tokens": llm.prompt_tokens}
+    return result
+
+
+def bench_agent(config):
+    from pydantic import BaseModel
+    from langgraph.graph import StateGraph, END
+
+    llm = make_llm(config)
+
+    # Same routing and nodes as task-02-agent-tools/agent.py
+    class AgentState(BaseModel):
+        input: str
+        output: str = ""
+
+    def route(state):
+        query = state.input.lower()
+        if "ticket" in query or "showtime" in query or "timing" in query:
+            return "ticket_node"
+        elif "box office" in query or "predict earnings" in query or "how much will" in query or "budget" in query or "collection" in query:
+            return "box_office_node"
+        elif "movie" in query or "about" in query or "who directed" in query or "plot" in query or "cast" in query or "avatar" in query:
+            return "movie_info_node"
+        else:
+            return "fallback_node"
+
+    def ticket_node(state):
+        return {"output": "🎟️ Tickets available."}
+
+    def box_office_node(state):
+        return {"output": llm.invoke(f"Search online and summarize the latest box office forecast for: {state.input}.").content}
+
+    def movie_info_node(state):
+        return {"output": llm.invoke(f"Search online and summarize key facts, plot, or cast details about: {state.input}.").content}
+
+    def fallback_node(state):
+        return {"output": "🤖 I can help with ticket info, box office predictions, or movie facts."}
+
+    graph = StateGraph(AgentState)
+    graph.add_node("entry", lambda state: state)
+    for name, node in [("ticket_node", ticket_node), ("box_office_node", box_office_node),
+                       ("movie_info_node", movie_info_node), ("fallback_node", fallback_node)]:
+        graph.add_node(name, node)
+        graph.add_edge(name, END)
+    graph.add_conditional_edges("entry", route, {
+        "ticket_node": "ticket_node",
+        "box_office_node": "box_office_node",
+        "movie_info_node": "movie_info_node",
+        "fallback_node": "fallback_node",
+    })
+    graph.set_entry_point("entry")
+    agent = graph.compile()
+
+    latencies, wall = timed(lambda q: agent.invoke({"input": q}), AGENT_QUERIES, config["repeats"])
+    result = summarize_latencies(latencies, wall)
+    result["extra"] = {"llm_calls": llm.calls}
+    return result
+
+
+def load_summary_text():
+    import PyPDF2
+
+    with open(SUMMARY_PDF_PATH, "rb") as f:
+        reader = PyPDF2.PdfReader(f)
+        return "\n".join(page.extract_text() for page in reader.pages if page.extract_text())
+
+
+def summary_chunks(text, config):
+    from langchain.docstore.document import Document
+    from common.chunking import summary_splitter
+
+    return summary_splitter(make_token_counter(config)).split_documents([Document(page_content=text)])
+
+
+def _bench_summarize(config, chain_type):
+    from langchain.chains.summarize import load_summarize_chain
+
+    llm = make_llm(config)
+    text = load_summary_text()
+    chain = load_summarize_chain(llm, chain_type=chain_type)
+    latencies, wall = timed(lambda t: chain.invoke({"input_documents": summary_chunks(t, config)}), [text], config["repeats"])
+    result = summarize_latencies(latencies, wall)
+    result["extra"] = {
+        "chunks": len(summary_chunks(text, config)),
+        "llm_calls": llm.calls,
+        "prompt_tokens": llm.prompt_tokens,
+    }
+    return result
+
+
+def bench_summarize_map_reduce(config):
+    return _bench_summarize(config, "map_reduce")
+
+
+def bench_summarize_refine(config):
+    return _bench_summarize(config, "refine")
+
+
+BENCHMARKS = {
+    "index_build": bench_index_build,
+    "retrieval": bench_retrieval,
+    "qa": bench_qa,
+    "sql": bench_sql,
+    "agent": bench_agent,
+    "summarize_map_reduce": bench_summarize_map_reduce,
+    "summarize_refine": bench_summarize_refine,
+}
+
+
+# --------------------------
+# 3️⃣ Runner
+# --------------------------
+def run_in_process(name, config):
+    result = BENCHMARKS[name](config)
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """Return a list of human-readable regressions against a previous run."""
+    regressions = []
+    for name, current in results["tasks"].items():
+        previous = baseline.get("tasks", {}).get(name)
+        if not previous:
+            continue
+        checks = [
+            ("p95 latency", current["latency_ms"]["p95"], previous["latency_ms"]["p95"], True),
+            ("throughput", current["throughput_ops_s"], previous["throughput_ops_s"], False),
+            ("peak RSS", current.get("peak_rss_mb"), previous.get("peak_rss_mb"), True),
+        ]
+        for label, now, before, higher_is_worse in checks:
+            if now is None or not before:
+                continue
+            change = (now - before) / before
+            if (change > tolerance) if higher_is_worse else (change < -tolerance):
+                regressions.append(f"{name}: {label} {before} → {now} ({change:+.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the EntertainAI task pipelines.")
+    parser.add_argument("--tasks", nargs="+", choices=sorted(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--repeats", type=int, default=3, help="Passes over each input set")
+    parser.add_argument("--embeddings", choices=["minilm", "hash"], default="minilm",
+                        help="'minilm' uses the local HuggingFace model and tokenizers from the task scripts; "
+                             "'hash' needs no model download (hash embeddings, ~4 characters per token)")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated delay per stub LLM call")
+    parser.add_argument("--rerank", action="store_true", help="Rerank retrieval with the cached cross-encoder")
+    parser.add_argument("--output", default=os.path.join(BASE_DIR, "results.json"))
+    parser.add_argument("--compare", help="Baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative change before flagging")
+    args = parser.parse_args()
+
+    config = {
+        "repeats": args.repeats,
+        "embeddings": args.embeddings,
+        "llm_latency_ms": args.llm_latency_ms,
+        "rerank": args.rerank,
+    }
+    results = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            **config,
+        },
+        "tasks": {},
+    }
+
+    ctx = multiprocessing.get_context("spawn")
+    for name in args.tasks:
+        print(f"⏱️ Running {name}...")
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            result = pool.submit(run_in_process, name, config).result()
+        results["tasks"][name] = result
+        lat = result["latency_ms"]
+        print(f"   {result['throughput_ops_s']} ops/s | p50 {lat['p50']} ms | p95 {lat['p95']} ms | "
+              f"peak RSS {result['peak_rss_mb']} MB")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"✅ Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("❌ Regressions against baseline:")
+            for line in regressions:
+                print("   " + line)
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
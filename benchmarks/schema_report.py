@@ -0,0 +1,73 @@
+"""Compare full ``table_info`` with the cached, compact schema catalog for SQL QA.
+
+Builds the seeded e-commerce database (optionally padded with unrelated
+tables) and measures prompt tokens and time-to-SQL per question, with and
+without ``SchemaCatalog``.
+
+    python benchmarks/schema_report.py --extra-tables 0 20 --ms-per-1k-tokens 400
+"""
+import os
+import tempfile
+import time
+
+from run_benchmarks import (
+    SQL_PROMPT, SQL_QUESTIONS, create_ecommerce_db, make_embeddings, make_llm, report_config, report_parser, write_report,
+)
+
+from langchain.prompts import PromptTemplate
+from langchain_community.utilities import SQLDatabase
+from langchain_experimental.sql import SQLDatabaseChain
+
+from common.schema_catalog import CatalogSQLDatabase, SchemaCatalog
+
+
+def run_mode(db, select, config):
+    llm = make_llm(config)
+    prompt = PromptTemplate(input_variables=["input", "table_info", "top_k"], template=SQL_PROMPT)
+    chain = SQLDatabaseChain.from_llm(llm=llm, db=db, prompt=prompt, return_sql=True)
+
+    times = []
+    for question in SQL_QUESTIONS:
+        t0 = time.perf_counter()
+        chain.invoke({"query": question, "table_names_to_use": select(question)})
+        times.append((time.perf_counter() - t0) * 1000)
+    return {
+        "prompt_tokens_per_question": round(llm.prompt_tokens / len(SQL_QUESTIONS), 1),
+        "time_to_sql_ms": round(sum(times) / len(times), 2),
+    }
+
+
+def main():
+    parser = report_parser("Before/after report for the schema catalog.")
+    parser.add_argument("--extra-tables", type=int, nargs="+", default=[0, 20],
+                        help="Unrelated tables added to the database, one run per value")
+    args = parser.parse_args()
+
+    config = report_config(args)
+    embeddings = make_embeddings(config)
+
+    report = {}
+    for extra in args.extra_tables:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_file = os.path.join(tmp, "ecommerce.db")
+            create_ecommerce_db(db_file, extra_tables=extra)
+            uri = f"sqlite:///{db_file}"
+
+            full_db = SQLDatabase.from_uri(uri)
+            catalog = SchemaCatalog(db_file, embeddings=embeddings)
+            catalog_db = CatalogSQLDatabase.from_uri(uri, catalog=catalog)
+            tables = len(catalog.table_names)  # introspects once, before the first question
+
+            print(f"🗄️ {tables} tables...")
+            report[f"{tables}_tables"] = {
+                "full_table_info": run_mode(full_db, lambda q: None, config),
+                "schema_catalog": run_mode(catalog_db, catalog.select, config),
+            }
+            full_db._engine.dispose()
+            catalog_db._engine.dispose()
+
+    write_report(report, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Shared helpers for the task scripts, benchmarks and batch jobs."""
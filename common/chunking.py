@@ -0,0 +1,164 @@
+"""Token-aware chunking for movie scripts.
+
+Character-based splitting maps poorly onto model tokens for Telugu text, so
+``ScriptTokenSplitter`` measures every piece with the model's tokenizer,
+keeps scenes and dialogue blocks intact where it can, and packs them into
+chunks close to a token budget.
+"""
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter, TextSplitter
+
+# Local embedding model shared by the RAG tasks, SQL schema catalog, benchmarks and batch jobs
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# RAG chunks are measured with the embedding model's own tokenizer
+DEFAULT_TOKENIZER = EMBEDDING_MODEL
+# MiniLM's uncased tokenizer drops Telugu vowel signs and viramas, so budgets for
+# text sent to Gemini are measured with a multilingual SentencePiece tokenizer
+LLM_TOKENIZER = "xlm-roberta-base"
+
+# all-MiniLM-L6-v2 truncates at 256 tokens, so larger RAG chunks are never fully embedded
+RAG_CHUNK_TOKENS = 250
+RAG_CHUNK_OVERLAP = 32
+SUMMARY_CHUNK_TOKENS = 2000
+SUMMARY_CHUNK_OVERLAP = 50
+
+# "Scene 12", "Scene - A", "SC. 12", "సీన్ 12", "సన్నివేశం 12", "12. INT. HOUSE", "EXT. ROAD", "REEL NO - 2",
+# and the censor script's timecoded headings ("00:01:48 Scene- 1 CLOCK TOWER CENTER", "00:09:50 Scene- MLA HOUSE")
+SCENE_RE = re.compile(
+    r"^\s*(?:\d{1,2}:\d{2}:\d{2}\s+scene\b"
+    r"|(?:scene|sc\.?)\s*(?:no\.?)?\s*[:\-]?\s*(?:\d+|(?-i:[A-Z])\b)"
+    r"|సీన్|సన్నివేశం|(?:\d+\s*[.)]\s*)?(?:int|ext)\b\.?|reel\s+no\b)",
+    re.IGNORECASE | re.MULTILINE,
+)
+# A speaker label such as "SRIKANTH :" or "శ్రీకాంత్:" opens a dialogue block. The colon must
+# directly follow the label and must not be part of a time ("10:30") or URL.
+SPEAKER_RE = re.compile(
+    r"^[ \t]*(?P<label>[^\s:]{1,30}(?:[ \t][^\s:]{1,30})?)[ \t]*:(?![\d/:])",
+    re.MULTILINE,
+)
+# Labels that look like speakers but are script annotations
+NON_SPEAKER_LABELS = {"note", "notes", "time", "date", "place", "location", "duration", "reel", "cut to", "fade in", "fade out"}
+
+
+def _is_speaker(match: re.Match) -> bool:
+    label = match.group("label").strip().lower()
+    if label in NON_SPEAKER_LABELS:
+        return False
+    # Digits-only labels are times, numbers or scene counters ("10:", "12.")
+    return not re.fullmatch(r"[\d.\s]+(?:am|pm)?", label)
+
+
+@lru_cache(maxsize=None)
+def load_tokenizer(name: str = DEFAULT_TOKENIZER):
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(name)
+
+
+def token_counter(name: str = DEFAULT_TOKENIZER):
+    tokenizer = load_tokenizer(name)
+
+    def count(text: str) -> int:
+        return len(tokenizer.encode(text, add_special_tokens=False, verbose=False))
+
+    return count
+
+
+def _split_at(pattern: re.Pattern, text: str, keep: Optional[Callable[[re.Match], bool]] = None) -> List[str]:
+    starts = [m.start() for m in pattern.finditer(text) if keep is None or keep(m)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    bounds = starts + [len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:]) if text[a:b].strip()]
+
+
+class ScriptTokenSplitter(TextSplitter):
+    """Split scripts by scene and dialogue block, packing pieces up to ``chunk_size`` tokens.
+
+    A new scene starts a new chunk once the current one is at least
+    ``scene_fill`` of the budget; smaller scenes are packed together.
+    Blocks larger than the budget fall back to recursive splitting.
+    Overlap only carries blocks of the scene the next chunk continues.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = RAG_CHUNK_TOKENS,
+        chunk_overlap: int = RAG_CHUNK_OVERLAP,
+        tokenizer_name: str = DEFAULT_TOKENIZER,
+        scene_fill: float = 0.5,
+        **kwargs: Any,
+    ) -> None:
+        # A custom length_function (e.g. a model's own token counter) overrides tokenizer_name
+        count = kwargs.pop("length_function", None) or token_counter(tokenizer_name)
+        super().__init__(chunk_size=chunk_size, chunk_overlap=chunk_overlap, length_function=count, **kwargs)
+        self._scene_fill = scene_fill
+        # Pieces keep their separators and whitespace, so a split block joins back exactly
+        self._fallback = RecursiveCharacterTextSplitter(
+            chunk_size=max(chunk_overlap, chunk_size // 4),
+            chunk_overlap=0,
+            length_function=count,
+            separators=["\n\n", "\n", ". ", "? ", "! ", " ", ""],
+            keep_separator="end",
+            strip_whitespace=False,
+        )
+
+    def _units(self, text: str) -> List[Tuple[str, int, bool, bool]]:
+        """``(piece, tokens, starts_block, starts_scene)`` for every piece of ``text``, in order."""
+        units = []
+        for scene in _split_at(SCENE_RE, text):
+            starts_scene = True
+            for block in _split_at(SPEAKER_RE, scene, keep=_is_speaker):
+                block = block.strip()
+                tokens = self._length_function(block)
+                pieces = [block] if tokens <= self._chunk_size else self._fallback.split_text(block)
+                for i, piece in enumerate(pieces):
+                    n = tokens if len(pieces) == 1 else self._length_function(piece)
+                    units.append((piece, n, i == 0, starts_scene))
+                    starts_scene = False
+        return units
+
+    @staticmethod
+    def _join(units: List[Tuple[str, int, bool, bool]]) -> str:
+        # Blocks go on their own line; pieces of a split block are glued back as they were
+        return "".join(("\n" if starts_block else "") + piece for piece, _, starts_block, _ in units).strip()
+
+    def split_text(self, text: str) -> List[str]:
+        chunks: List[str] = []
+        current: List[Tuple[str, int, bool, bool]] = []
+        size = 0
+        for unit in self._units(text):
+            n, starts_scene = unit[1], unit[3]
+            full = current and size + n > self._chunk_size
+            scene_break = current and starts_scene and size >= self._scene_fill * self._chunk_size
+            if full or scene_break:
+                chunks.append(self._join(current))
+                if starts_scene:
+                    current, size = [], 0
+                else:
+                    # Carry trailing blocks of the same scene over as overlap, never an earlier packed scene
+                    scene_start = max((i for i, u in enumerate(current) if u[3]), default=0)
+                    size -= sum(u[1] for u in current[:scene_start])
+                    current = current[scene_start:]
+                    while current and (size > self._chunk_overlap or size + n > self._chunk_size):
+                        size -= current.pop(0)[1]
+            current.append(unit)
+            size += n
+        if current:
+            chunks.append(self._join(current))
+        return chunks
+
+
+def rag_splitter(length_function: Optional[Callable[[str], int]] = None) -> ScriptTokenSplitter:
+    """Chunks sized for the MiniLM embedding window (or by ``length_function``, e.g. an offline estimate)."""
+    return ScriptTokenSplitter(chunk_size=RAG_CHUNK_TOKENS, chunk_overlap=RAG_CHUNK_OVERLAP,
+                               tokenizer_name=DEFAULT_TOKENIZER, length_function=length_function)
+
+
+def summary_splitter(length_function: Optional[Callable[[str], int]] = None) -> ScriptTokenSplitter:
+    """Chunks sized in multilingual tokens for the Gemini summarization prompts."""
+    return ScriptTokenSplitter(chunk_size=SUMMARY_CHUNK_TOKENS, chunk_overlap=SUMMARY_CHUNK_OVERLAP,
+                               tokenizer_name=LLM_TOKENIZER, length_function=length_function)
@@ -0,0 +1,84 @@
+"""Shared LLM gateway for batch jobs.
+
+``LLMGateway`` wraps one chat model so many worker threads can share it:
+it caps the number of in-flight requests, retries transient failures
+(rate limits, timeouts, 5xx) with exponential backoff, and keeps simple
+usage counters. Wrapped clients should have their own retries disabled.
+"""
+import threading
+import time
+from typing import Any, List, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import PrivateAttr
+
+# HTTP statuses worth retrying: timeout, rate limit and server-side errors
+TRANSIENT_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+def is_transient(error: Exception) -> bool:
+    """True for errors a retry can fix; bad requests or blocked content fail the same way every time."""
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    # google.api_core errors carry the HTTP status as `code`, HTTP clients as `status_code`
+    status = getattr(error, "code", None) or getattr(error, "status_code", None)
+    try:
+        return int(status) in TRANSIENT_STATUS
+    except (TypeError, ValueError):
+        return False
+
+
+class LLMGateway(BaseChatModel):
+    """Concurrency-limited, retrying wrapper around a chat model."""
+
+    llm: BaseChatModel
+    max_concurrency: int = 4
+    max_retries: int = 3
+    backoff_s: float = 2.0
+    calls: int = 0
+    retries: int = 0
+    failures: int = 0
+
+    _semaphore: Any = PrivateAttr(default=None)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    def _slots(self) -> threading.BoundedSemaphore:
+        with self._lock:
+            if self._semaphore is None:
+                self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+            return self._semaphore
+
+    @property
+    def _llm_type(self) -> str:
+        return f"gateway-{self.llm._llm_type}"
+
+    def get_num_tokens(self, text: str) -> int:
+        # Chains size their prompts with this; the wrapped model knows its own tokenizer
+        return self.llm.get_num_tokens(text)
+
+    def _count(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self._count("calls")
+        for attempt in range(self.max_retries + 1):
+            try:
+                with self._slots():
+                    message = self.llm.invoke(messages, stop=stop, **kwargs)
+                return ChatResult(generations=[ChatGeneration(message=message)])
+            except Exception as e:
+                if attempt == self.max_retries or not is_transient(e):
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                time.sleep(self.backoff_s * 2 ** attempt)
@@ -0,0 +1,127 @@
+"""Cross-encoder reranking stage for the RetrievalQA chains.
+
+FAISS returns a wider candidate set, a small local cross-encoder rescores it
+on CPU in batches, and only the best chunks that fit a token budget are
+stuffed into the prompt. Scores are cached per (query, chunk) so repeated
+questions skip the model entirely.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain.retrievers import ContextualCompressionRetriever
+from langchain_core.callbacks import Callbacks
+from langchain_core.documents import BaseDocumentCompressor, Document
+from pydantic import PrivateAttr
+
+from common.chunking import LLM_TOKENIZER, token_counter
+
+# Multilingual MS MARCO cross-encoder (the scripts are in Telugu), small enough for CPU
+DEFAULT_CROSS_ENCODER = "cross-encoder/mmarco-mMiniLMv2-L12-H384-v1"
+RERANK_CANDIDATES = 20
+RERANK_TOP_N = 4
+CONTEXT_TOKEN_BUDGET = 800
+
+_load_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _cross_encoder(name: str):
+    from sentence_transformers import CrossEncoder
+
+    return CrossEncoder(name, device="cpu")
+
+
+def load_cross_encoder(name: str = DEFAULT_CROSS_ENCODER):
+    # lru_cache alone does not stop two threads loading the model at once
+    with _load_lock:
+        return _cross_encoder(name)
+
+
+class CachedCrossEncoderReranker(BaseDocumentCompressor):
+    """Rerank documents with a cross-encoder and trim them to ``token_budget`` tokens."""
+
+    model_name: str = DEFAULT_CROSS_ENCODER
+    top_n: int = RERANK_TOP_N
+    batch_size: int = 16
+    token_budget: Optional[int] = CONTEXT_TOKEN_BUDGET
+    # The budget limits the Gemini prompt, so it is counted in multilingual tokens
+    tokenizer_name: str = LLM_TOKENIZER
+    cache_size: int = 10_000
+
+    _model: Any = PrivateAttr(default=None)
+    _count: Any = PrivateAttr(default=None)
+    _cache: Any = PrivateAttr(default_factory=OrderedDict)
+    _lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._model is None:
+                self._model = load_cross_encoder(self.model_name)
+                self._count = token_counter(self.tokenizer_name)
+
+    def warm_up(self) -> None:
+        """Load the cross-encoder and tokenizer now instead of on the first query."""
+        self._load()
+
+    @staticmethod
+    def _key(query: str, text: str) -> Tuple[str, str]:
+        return query, hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def score(self, query: str, texts: Sequence[str]) -> List[float]:
+        """Cross-encoder scores for ``texts``, computing only the pairs not already cached."""
+        self._load()
+        keys = [self._key(query, t) for t in texts]
+        with self._lock:
+            cached: Dict[Tuple[str, str], float] = {k: self._cache[k] for k in keys if k in self._cache}
+            for k in cached:
+                self._cache.move_to_end(k)
+        missing = [(k, t) for k, t in zip(keys, texts) if k not in cached]
+        if missing:
+            pairs = [(query, t) for _, t in missing]
+            scores = self._model.predict(pairs, batch_size=self.batch_size, show_progress_bar=False)
+            with self._lock:
+                for (k, _), s in zip(missing, scores):
+                    cached[k] = float(s)
+                    self._cache[k] = float(s)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return [cached[k] for k in keys]
+
+    def compress_documents(
+        self,
+        documents: Sequence[Document],
+        query: str,
+        callbacks: Optional[Callbacks] = None,
+    ) -> Sequence[Document]:
+        if not documents:
+            return []
+        scores = self.score(query, [d.page_content for d in documents])
+        ranked = sorted(zip(documents, scores), key=lambda x: x[1], reverse=True)[: self.top_n]
+
+        selected = []
+        used = 0
+        for doc, score in ranked:
+            tokens = self._count(doc.page_content)
+            if selected and self.token_budget and used + tokens > self.token_budget:
+                continue  # a smaller, lower-ranked chunk may still fit
+            used += tokens
+            selected.append(Document(page_content=doc.page_content, metadata={**doc.metadata, "rerank_score": score}))
+        return selected
+
+
+def rerank_retriever(
+    vectorstore,
+    reranker: Optional[CachedCrossEncoderReranker] = None,
+    candidates: int = RERANK_CANDIDATES,
+) -> ContextualCompressionRetriever:
+    """Wrap a vector store so it fetches ``candidates`` hits and returns the reranked, trimmed subset.
+
+    Pass a shared ``reranker`` to reuse its model and score cache across vector stores.
+    """
+    return ContextualCompressionRetriever(
+        base_compressor=reranker or CachedCrossEncoderReranker(),
+        base_retriever=vectorstore.as_retriever(search_kwargs={"k": candidates}),
+    )
@@ -0,0 +1,211 @@
+"""Cached, question-aware schema for the SQL QA prompt.
+
+``SQLDatabase.get_table_info`` re-reflects the schema and samples rows from
+every table on each question. ``SchemaCatalog`` introspects a SQLite file
+once (again only when its mtime changes), picks the tables and columns a
+question needs by keyword and embedding similarity, and renders them in a
+compact one-line-per-table form with cached sample rows.
+"""
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from langchain_community.utilities import SQLDatabase
+
+SAMPLE_ROWS = 2
+MAX_TABLES = 3
+MAX_COLUMNS = 12
+# Tables with no keyword hit need at least this embedding similarity to be included
+MIN_SIMILARITY = 0.35
+
+
+def _words(text: str) -> set:
+    words = set()
+    for w in re.findall(r"[a-z0-9]+", text.lower().replace("_", " ")):
+        words.add(w)
+        # naive singular so "products" matches "product_id"
+        if w.endswith("ies"):
+            words.add(w[:-3] + "y")
+        elif w.endswith("s"):
+            words.add(w[:-1])
+    return words
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = (sum(x * x for x in a) ** 0.5) * (sum(y * y for y in b) ** 0.5)
+    return dot / norm if norm else 0.0
+
+
+class SchemaCatalog:
+    """Introspect a SQLite database once and serve compact, relevant schema snippets."""
+
+    def __init__(self, db_file: str, embeddings=None, sample_rows: int = SAMPLE_ROWS,
+                 max_tables: int = MAX_TABLES, max_columns: int = MAX_COLUMNS):
+        self.db_file = db_file
+        self.embeddings = embeddings
+        self.sample_rows = sample_rows
+        self.max_tables = max_tables
+        self.max_columns = max_columns
+        self._mtime = None
+        self._tables: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        # Columns picked by the last select() on this thread; SQLDatabaseChain only
+        # passes table names to get_table_info, so the question cannot travel with it
+        self._local = threading.local()
+
+    # --------------------------
+    # Introspection (cached on DB mtime)
+    # --------------------------
+    def _refresh(self) -> None:
+        mtime = os.path.getmtime(self.db_file)
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            conn = sqlite3.connect(self.db_file)
+            try:
+                names = [r[0] for r in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name")]
+                tables = {}
+                for name in names:
+                    columns = [
+                        {"name": c[1], "type": c[2] or "", "pk": bool(c[5])}
+                        for c in conn.execute(f'PRAGMA table_info("{name}")')
+                    ]
+                    fks = {fk[3]: f"{fk[2]}.{fk[4]}" for fk in conn.execute(f'PRAGMA foreign_key_list("{name}")')}
+                    rows = conn.execute(f'SELECT * FROM "{name}" LIMIT {self.sample_rows}').fetchall()
+                    tables[name] = {
+                        "columns": columns,
+                        "fks": fks,
+                        "rows": rows,
+                        "words": _words(name),
+                        "text": f"{name}: " + ", ".join(c["name"] for c in columns),
+                    }
+            finally:
+                conn.close()
+            if self.embeddings is not None and tables:
+                vectors = self.embeddings.embed_documents([t["text"] for t in tables.values()])
+                for table, vector in zip(tables.values(), vectors):
+                    table["vector"] = vector
+                column_texts = [f"{name} {c['name'].replace('_', ' ')}" for name, t in tables.items() for c in t["columns"]]
+                column_vectors = iter(self.embeddings.embed_documents(column_texts))
+                for table in tables.values():
+                    table["column_vectors"] = [next(column_vectors) for _ in table["columns"]]
+            self._tables = tables
+            self._mtime = mtime
+
+    @property
+    def table_names(self) -> List[str]:
+        self._refresh()
+        return list(self._tables)
+
+    # --------------------------
+    # Selection
+    # --------------------------
+    def _neighbours(self, name: str) -> List[str]:
+        linked = [ref.split(".")[0] for ref in self._tables[name]["fks"].values()]
+        linked += [other for other, t in self._tables.items()
+                   if any(ref.split(".")[0] == name for ref in t["fks"].values())]
+        return [n for n in dict.fromkeys(linked) if n in self._tables and n != name]
+
+    def select(self, question: str) -> List[str]:
+        """Tables relevant to ``question``: the best match, the tables it joins to, then other matches.
+
+        Every table is returned when nothing matches the question. The columns picked
+        for each table are recorded for this thread and used by the next ``table_info``
+        call that does not pass a question itself.
+        """
+        self._refresh()
+        words = _words(question)
+        query_vector = self.embeddings.embed_query(question) if self.embeddings is not None else None
+
+        scores = {}
+        relevant = set()
+        for name, table in self._tables.items():
+            keyword = 3 * len(words & table["words"])
+            keyword += sum(1 for c in table["columns"] if _words(c["name"]) & words)
+            similarity = _cosine(query_vector, table["vector"]) if query_vector is not None else 0.0
+            scores[name] = keyword + 2 * similarity
+            if keyword > 0 or similarity >= MIN_SIMILARITY:
+                relevant.add(name)
+
+        ranked = sorted(scores, key=scores.get, reverse=True)
+        if not relevant:
+            # No keyword or embedding hit: a compact guess could hide the tables the SQL needs
+            selected = ranked
+        else:
+            # Join neighbours go in even without a hit of their own: "revenue by region"
+            # matches customers, but the amounts live in orders
+            selected = [ranked[0]] + self._neighbours(ranked[0])
+            selected += [name for name in ranked[1:] if name in relevant and name not in selected]
+            selected = selected[: self.max_tables]
+        self._local.columns = {name: self._columns(self._tables[name], words, query_vector) for name in selected}
+        return selected
+
+    # --------------------------
+    # Rendering
+    # --------------------------
+    def _columns(self, table: dict, words: set, query_vector: Optional[List[float]] = None) -> List[int]:
+        """Column indexes to show: keys, then keyword matches, then the most similar columns."""
+        cols = table["columns"]
+        if len(cols) <= self.max_columns:
+            return list(range(len(cols)))
+        keep = [i for i, c in enumerate(cols) if c["pk"] or c["name"] in table["fks"]]
+        keep += [i for i, c in enumerate(cols) if i not in keep and _words(c["name"]) & words]
+        rest = [i for i in range(len(cols)) if i not in keep]
+        if query_vector is not None and "column_vectors" in table:
+            rest.sort(key=lambda i: _cosine(query_vector, table["column_vectors"][i]), reverse=True)
+        keep += rest
+        return sorted(keep[: self.max_columns])
+
+    def table_info(self, table_names: Optional[List[str]] = None, question: Optional[str] = None) -> str:
+        """Compact schema with cached sample rows, e.g. ``orders(id INTEGER PK, product_id INTEGER -> products.id)``.
+
+        Columns come from ``question`` if given, else from the last ``select()`` on this thread.
+        Unknown table names raise ``ValueError``, as ``SQLDatabase.get_table_info`` does.
+        """
+        self._refresh()
+        if table_names is not None:
+            missing_tables = set(table_names).difference(self._tables)
+            if missing_tables:
+                raise ValueError(f"table_names {missing_tables} not found in database")
+        if question is not None:
+            words = _words(question)
+            query_vector = self.embeddings.embed_query(question) if self.embeddings is not None else None
+            picked = {}
+        else:
+            words, query_vector = set(), None
+            picked = getattr(self._local, "columns", {})
+        lines = []
+        for name in table_names or self._tables:
+            table = self._tables[name]
+            keep = picked.get(name)
+            if not keep or max(keep) >= len(table["columns"]):  # nothing recorded, or the schema changed since
+                keep = self._columns(table, words, query_vector)
+            cols = []
+            for i in keep:
+                c = table["columns"][i]
+                col = f"{c['name']} {c['type']}".strip()
+                if c["pk"]:
+                    col += " PK"
+                if c["name"] in table["fks"]:
+                    col += f" -> {table['fks'][c['name']]}"
+                cols.append(col)
+            lines.append(f"{name}({', '.join(cols)})")
+            for row in table["rows"]:
+                values = [row[i] for i in keep]
+                lines.append("  e.g. " + repr(tuple(str(v)[:30] if isinstance(v, str) else v for v in values)))
+        return "\n".join(lines)
+
+
+class CatalogSQLDatabase(SQLDatabase):
+    """``SQLDatabase`` whose ``table_info`` comes from a ``SchemaCatalog`` instead of live reflection."""
+
+    def __init__(self, engine, catalog: SchemaCatalog, **kwargs):
+        super().__init__(engine, **kwargs)
+        self.catalog = catalog
+
+    def get_table_info(self, table_names: Optional[List[str]] = None) -> str:
+        return self.catalog.table_info(table_names)
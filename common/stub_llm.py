@@ -0,0 +1,88 @@
+"""Deterministic offline chat model used in place of Gemini for benchmarks and dry runs."""
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+_lock = threading.Lock()
+
+
+def approx_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token), good enough for relative comparisons."""
+    return max(1, len(text) // 4)
+
+
+def sql_question(prompt: str) -> str:
+    """The user question from a ``SQLDatabaseChain`` prompt, without the schema around it."""
+    before = prompt.rsplit("SQLQuery:", 1)[0]
+    if "Question:" in before:
+        return before.rsplit("Question:", 1)[1].strip()
+    lines = before.strip().splitlines()
+    return lines[-1] if lines else ""
+
+
+class StubChatModel(BaseChatModel):
+    """Chat model that answers instantly (or with a simulated delay) and counts its usage.
+
+    * Prompts from ``SQLDatabaseChain`` get a canned SQL query picked by keyword
+      from ``sql_responses``; the follow-up answer step gets a short answer.
+    * Every other prompt gets a fixed-length reply built from the prompt text,
+      so map-reduce and refine chains see realistic intermediate sizes.
+    """
+
+    sql_responses: Dict[str, str] = {}
+    default_sql: str = "SELECT 1;"
+    reply_words: int = 60
+    base_latency: float = 0.0
+    latency_per_token: float = 0.0
+    calls: int = 0
+    prompt_tokens: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat"
+
+    def reset_usage(self) -> None:
+        with _lock:
+            self.calls = 0
+            self.prompt_tokens = 0
+
+    def get_num_tokens(self, text: str) -> int:
+        # The default loads the GPT-2 tokenizer from the Hugging Face Hub (map-reduce calls this)
+        return approx_tokens(text)
+
+    def _reply(self, prompt: str) -> str:
+        if "SQLResult:" in prompt:
+            return "Here is the answer based on the query result."
+        if "SQLQuery:" in prompt:
+            question = sql_question(prompt).lower()
+            for keyword, sql in self.sql_responses.items():
+                if keyword in question:
+                    return sql
+            return self.default_sql
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:8]
+        words = prompt.split()[-self.reply_words:]
+        return f"[stub {digest}] " + " ".join(words)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        prompt = "\n".join(str(m.content) for m in messages)
+        tokens = approx_tokens(prompt)
+        with _lock:
+            self.calls += 1
+            self.prompt_tokens += tokens
+        delay = self.base_latency + self.latency_per_token * tokens
+        if delay:
+            time.sleep(delay)
+        message = AIMessage(content=self._reply(prompt))
+        return ChatResult(generations=[ChatGeneration(message=message)])
@@ -1,15 +1,20 @@
 import os
+import sys
 import gradio as gr
 from dotenv import load_dotenv
 
 # LangChain + Gemini
 from langchain_google_genai import ChatGoogleGenerativeAI  # type: ignore
 from langchain.chains import RetrievalQA
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_community.embeddings import HuggingFaceEmbeddings  # ✅ Local embeddings
 
+# Shared helpers (repo root)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from common.chunking import EMBEDDING_MODEL, rag_splitter
+from common.rerank import rerank_retriever
+
 # 1. Load API key
 load_dotenv()
 api_key = os.getenv("GEMINI_API_KEY")
@@ -33,22 +38,29 @@ loader = PyPDFLoader(pdf_path)
 docs = loader.load()
 print("✅ Loaded", len(docs), "documents")
 
-# 4. Split into chunks
-splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+# 4. Split into token-sized chunks (scene/dialogue aware)
+splitter = rag_splitter()
 chunks = splitter.split_documents(docs)
+print("✅ Split into", len(chunks), "chunks")
 
 # 5. HuggingFace Embeddings (no Google quota)
 print("🔍 Using HuggingFace embeddings...")
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
 
 # 6. Create FAISS vector DB
 print("🗂️ Building FAISS index...")
 vectorstore = FAISS.from_documents(chunks, embeddings)
 
-# 7. RetrievalQA chain
+# 7. RetrievalQA chain (set RAG_RERANK=1 to rerank a wider candidate set with a cross-encoder)
+if os.getenv("RAG_RERANK") == "1":
+    print("🎯 Reranking retrieved chunks with a cross-encoder...")
+    retriever = rerank_retriever(vectorstore)
+else:
+    retriever = vectorstore.as_retriever()
+
 qa = RetrievalQA.from_chain_type(
     llm=llm,
-    retriever=vectorstore.as_retriever(),
+    retriever=retriever,
     return_source_documents=True,
     verbose=True,
 )
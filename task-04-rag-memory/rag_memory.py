@@ -1,15 +1,20 @@
 import os
+import sys
 import gradio as gr
 from dotenv import load_dotenv
 
 # LangChain + Gemini
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 from langchain.chains import RetrievalQA
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_community.embeddings import HuggingFaceEmbeddings
 
+# Shared helpers (repo root)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.chunking import EMBEDDING_MODEL, rag_splitter
+from common.rerank import CachedCrossEncoderReranker, rerank_retriever
+
 # 1. Load API key
 load_dotenv()
 api_key = os.getenv("GEMINI_API_KEY")
@@ -24,18 +29,24 @@ llm = ChatGoogleGenerativeAI(
 )
 
 # 3. Use HuggingFace embeddings (no quota issues)
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+embeddings = HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+splitter = rag_splitter()
+# One reranker for every uploaded PDF: the model loads once and cached scores are keyed by chunk text
+reranker = CachedCrossEncoderReranker() if os.getenv("RAG_RERANK") == "1" else None
 
 # 4. Build RAG pipeline from uploaded PDF
 def build_qa_chain(pdf_file):
     loader = PyPDFLoader(pdf_file.name)
     docs = loader.load()
 
-    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
     chunks = splitter.split_documents(docs)
 
     vectorstore = FAISS.from_documents(chunks, embeddings)
-    retriever = vectorstore.as_retriever()
+    # Set RAG_RERANK=1 to rerank a wider candidate set with a cross-encoder
+    if reranker is not None:
+        retriever = rerank_retriever(vectorstore, reranker=reranker)
+    else:
+        retriever = vectorstore.as_retriever()
 
     qa_chain = RetrievalQA.from_chain_type(
         llm=llm,
@@ -1,4 +1,5 @@
 import os
+import sys
 import random
 import sqlite3
 from datetime import datetime, timedelta
@@ -10,11 +11,16 @@ import re
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_experimental.sql import SQLDatabaseChain
 from langchain.prompts import PromptTemplate
-from langchain_community.utilities import SQLDatabase
+from langchain_community.embeddings import HuggingFaceEmbeddings
 
 # Gemini SDK
 import google.generativeai as genai
 
+# Shared helpers (repo root)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from common.chunking import EMBEDDING_MODEL
+from common.schema_catalog import CatalogSQLDatabase, SchemaCatalog
+
 # --------------------------
 # 1️⃣ Load API Key
 # --------------------------
@@ -121,7 +127,11 @@ print("✅ Database 'ecommerce.db' created successfully!")
 # 4️⃣ LangChain SQL QA Chain
 # --------------------------
 llm = ChatGoogleGenerativeAI(model=model_name, google_api_key=api_key)
-db = SQLDatabase.from_uri(f"sqlite:///{db_file}")
+
+# Schema is introspected once (refreshed when the DB file changes); each question
+# only gets the relevant tables in compact form with cached sample rows
+catalog = SchemaCatalog(db_file, embeddings=HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL))
+db = CatalogSQLDatabase.from_uri(f"sqlite:///{db_file}", catalog=catalog)
 
 prompt = PromptTemplate(
     input_variables=["input", "table_info", "top_k"],
@@ -160,7 +170,8 @@ with gr.Blocks(title="🛒 E-Commerce SQL QA Agent") as demo:
 
     def answer_query(user, history):
         try:
-            result = sql_chain.invoke({"query": user})
+            tables = catalog.select(user)
+            result = sql_chain.invoke({"query": user, "table_names_to_use": tables})
             raw_sql = result["intermediate_steps"]["sql_cmd"]
             clean_sql = strip_markdown_sql(raw_sql)
             db_result = db.run(clean_sql)
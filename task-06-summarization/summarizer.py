@@ -1,5 +1,6 @@
 import os
 import re
+import sys
 import gradio as gr
 from dotenv import load_dotenv
 
@@ -7,12 +8,15 @@ from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.chains.summarize import load_summarize_chain
 from langchain.docstore.document import Document
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 # PDF/Text handling
 import PyPDF2
 import google.generativeai as genai
 
+# Shared helpers (repo root)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.chunking import summary_splitter
+
 # --------------------------
 # 1️⃣ Load API Key
 # --------------------------
@@ -48,10 +52,11 @@ def extract_text(file):
     return text
 
 # --------------------------
-# 5️⃣ Chunking
+# 5️⃣ Chunking (multilingual token budget, scene/dialogue aware)
 # --------------------------
+splitter = summary_splitter()
+
 def chunk_text(text):
-    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
     return splitter.split_documents([Document(page_content=text)])
 
 # --------------------------
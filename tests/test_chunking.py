@@ -0,0 +1,116 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("langchain")
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.chunking import SCENE_RE, SPEAKER_RE, ScriptTokenSplitter, _is_speaker
+
+
+def words(text):
+    return len(text.split())
+
+
+def line(speaker, n, start=0):
+    return f"{speaker} : " + " ".join(f"w{i}" for i in range(start, start + n))
+
+
+def speaker(text):
+    match = SPEAKER_RE.match(text)
+    return bool(match and _is_speaker(match))
+
+
+# Heading lines as PyPDF2 extracts them from Jathi_rathanalu_censor_script_telugu.pdf
+@pytest.mark.parametrize("heading", [
+    " 00:01:48 Scene- 1 CLOCK TOWER CENTER",
+    " 00:01:10 Scene - A Statutory Warning",
+    " 00:03:58 Scene-B THANKS CARDS",
+    "00:02:20 Scene - 27    HOUSE OF SRIKANT",
+    " 00:09:50 Scene- MLA HOUSE",
+    "REEL NO - 2",
+])
+def test_censor_script_headings_start_scenes(heading):
+    assert SCENE_RE.match(heading)
+
+
+@pytest.mark.parametrize("text", [
+    "and running with a cycle chain.... they are creating a scene....",
+    "END OF THE REEL NO: 1",
+    "00:00:10 SPACE LEFT FOR C.B.F.C CERTIFICATE",
+])
+def test_other_lines_do_not_start_scenes(text):
+    assert not SCENE_RE.match(text)
+
+
+def test_timecoded_scene_starts_a_new_chunk():
+    text = "\n".join([
+        " 00:01:48 Scene- 1 CLOCK TOWER CENTER",
+        line("SEKHAR", 10),
+        " 00:01:58 Scene-2 SCHOOL",
+        line("SRIKANTH", 10),
+    ])
+    splitter = ScriptTokenSplitter(chunk_size=30, chunk_overlap=0, length_function=words)
+
+    chunks = splitter.split_text(text)
+
+    assert len(chunks) == 2
+    assert chunks[0].startswith("00:01:48 Scene- 1") and "Scene-2" not in chunks[0]
+    assert chunks[1].startswith("00:01:58 Scene-2 SCHOOL")
+
+
+@pytest.mark.parametrize("text", ["SRIKANTH : Where were you?", "shekar : Don't create scene", "శ్రీకాంత్: ఎక్కడ ఉన్నావు?"])
+def test_speaker_labels(text):
+    assert speaker(text)
+
+
+@pytest.mark.parametrize("text", [
+    "10:30 pm they reach the station",
+    "10 : 30 pm",
+    "Note: dialogue muted",
+    "http://example.com/trailer",
+    "END OF THE REEL NO: 1",
+])
+def test_annotations_are_not_speakers(text):
+    assert not speaker(text)
+
+
+def test_blocks_are_packed_up_to_chunk_size():
+    text = "\n".join(line(name, 3) for name in "ABCDEF")  # 5 words per block
+    splitter = ScriptTokenSplitter(chunk_size=10, chunk_overlap=0, length_function=words)
+
+    chunks = splitter.split_text(text)
+
+    assert chunks == [line("A", 3) + "\n" + line("B", 3), line("C", 3) + "\n" + line("D", 3), line("E", 3) + "\n" + line("F", 3)]
+
+
+def test_trailing_blocks_carry_over_as_overlap():
+    text = "\n".join(line(name, 3) for name in "ABC")
+    splitter = ScriptTokenSplitter(chunk_size=10, chunk_overlap=5, length_function=words)
+
+    chunks = splitter.split_text(text)
+
+    assert chunks == [line("A", 3) + "\n" + line("B", 3), line("B", 3) + "\n" + line("C", 3)]
+
+
+def test_overlap_does_not_cross_a_packed_scene_boundary():
+    # Scene 1 is too small to close a chunk, so both scenes are packed together
+    text = "\n".join(["Scene 1", line("A", 3), "Scene 2", line("B", 3), line("C", 6)])
+    splitter = ScriptTokenSplitter(chunk_size=20, chunk_overlap=12, scene_fill=0.9, length_function=words)
+
+    chunks = splitter.split_text(text)
+
+    assert chunks[0] == "\n".join(["Scene 1", line("A", 3), "Scene 2", line("B", 3)])
+    assert chunks[1] == "\n".join(["Scene 2", line("B", 3), line("C", 6)])
+
+
+def test_oversized_block_is_split_without_breaking_lines():
+    block = line("SEKHAR", 40)
+    splitter = ScriptTokenSplitter(chunk_size=20, chunk_overlap=0, length_function=words)
+
+    chunks = splitter.split_text(block)
+
+    assert len(chunks) > 1
+    assert all("\n" not in chunk and words(chunk) <= 20 for chunk in chunks)
+    assert " ".join(chunks) == block
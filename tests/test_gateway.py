@@ -0,0 +1,66 @@
+import os
+import sys
+from typing import List
+
+import pytest
+
+pytest.importorskip("langchain_core")
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.gateway import LLMGateway, is_transient
+from common.stub_llm import StubChatModel
+
+
+class FlakyModel(StubChatModel):
+    """Stub that raises the queued errors, one per call, before answering."""
+
+    errors: List[Exception] = []
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        if self.errors:
+            raise self.errors.pop(0)
+        return super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+
+class StatusError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+@pytest.mark.parametrize("error, transient", [
+    (TimeoutError("read timed out"), True),
+    (ConnectionError("reset by peer"), True),
+    (StatusError(429), True),
+    (StatusError(503), True),
+    (StatusError(400), False),
+    (ValueError("response blocked by safety filters"), False),
+])
+def test_is_transient(error, transient):
+    assert is_transient(error) is transient
+
+
+def test_transient_error_is_retried_then_succeeds():
+    llm = FlakyModel(errors=[TimeoutError("slow"), StatusError(429)])
+    gateway = LLMGateway(llm=llm, max_retries=3, backoff_s=0)
+
+    assert gateway.invoke("Who is Chitti?").content.startswith("[stub")
+    assert (gateway.calls, gateway.retries, gateway.failures) == (1, 2, 0)
+
+
+def test_non_transient_error_fails_immediately():
+    llm = FlakyModel(errors=[ValueError("blocked")])
+    gateway = LLMGateway(llm=llm, max_retries=3, backoff_s=0)
+
+    with pytest.raises(ValueError):
+        gateway.invoke("Who is Chitti?")
+    assert (gateway.calls, gateway.retries, gateway.failures) == (1, 0, 1)
+
+
+def test_transient_error_fails_after_max_retries():
+    llm = FlakyModel(errors=[TimeoutError("slow")] * 3)
+    gateway = LLMGateway(llm=llm, max_retries=2, backoff_s=0)
+
+    with pytest.raises(TimeoutError):
+        gateway.invoke("Who is Chitti?")
+    assert (gateway.calls, gateway.retries, gateway.failures) == (1, 2, 1)
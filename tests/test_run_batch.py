@@ -0,0 +1,40 @@
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "batch"))
+from run_batch import completed_ids, open_output
+
+# An interrupted run: q4 was cut off mid-write
+INTERRUPTED = (
+    '{"id": "q1", "status": "ok", "answer": "a"}\n'
+    '{"id": "q2", "status": "failed", "error": "TimeoutError: slow"}\n'
+    '{"id": "q3", "status": "ok", "answer": "c"}\n'
+    '{"id": "q4", "status": "o'
+)
+
+
+def test_resume_skips_ok_items_and_retries_failed_ones(tmp_path):
+    output = tmp_path / "answers.jsonl"
+    output.write_text(INTERRUPTED, encoding="utf-8")
+
+    assert completed_ids(str(output)) == {"q1", "q3"}
+
+
+def test_resume_with_no_output_yet(tmp_path):
+    assert completed_ids(str(tmp_path / "answers.jsonl")) == set()
+
+
+def test_append_after_partial_line_starts_a_new_record(tmp_path):
+    output = tmp_path / "answers.jsonl"
+    output.write_text(INTERRUPTED, encoding="utf-8")
+
+    with open_output(str(output)) as out:
+        out.write(json.dumps({"id": "q2", "status": "ok", "answer": "b"}) + "\n")
+        out.write(json.dumps({"id": "q4", "status": "ok", "answer": "d"}) + "\n")
+
+    assert completed_ids(str(output)) == {"q1", "q2", "q3", "q4"}
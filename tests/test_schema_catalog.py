@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import sys
+
+import pytest
+
+pytest.importorskip("langchain_community")
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.schema_catalog import CatalogSQLDatabase, SchemaCatalog
+
+WIDE_COLUMNS = ["sku", "shelf", "aisle", "supplier", "discount", "weight_kg", "colour", "barcode",
+                "reorder_level", "warehouse_code", "batch_no", "expiry_date"]
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    path = str(tmp_path / "shop.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT, region TEXT)")
+    conn.execute("CREATE TABLE inventory (id INTEGER PRIMARY KEY, "
+                 + ", ".join(f"{c} TEXT" for c in WIDE_COLUMNS) + ")")
+    conn.execute("INSERT INTO inventory VALUES (" + ", ".join("?" * (len(WIDE_COLUMNS) + 1)) + ")",
+                 [1] + [f"v{i}" for i in range(len(WIDE_COLUMNS))])
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def orders_db(tmp_path):
+    # Same tables and keys as the seeded e-commerce database in task 5
+    path = str(tmp_path / "orders.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+    CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT, age INTEGER, email TEXT, region TEXT);
+    CREATE TABLE products (id INTEGER PRIMARY KEY, name TEXT, category TEXT, price REAL, rating REAL);
+    CREATE TABLE orders (
+        id INTEGER PRIMARY KEY, customer_id INTEGER, product_id INTEGER, quantity INTEGER,
+        order_date TEXT, total_price REAL,
+        FOREIGN KEY(customer_id) REFERENCES customers(id),
+        FOREIGN KEY(product_id) REFERENCES products(id)
+    );
+    """)
+    conn.close()
+    return path
+
+
+def test_select_prunes_wide_table_to_question_columns(db_file):
+    catalog = SchemaCatalog(db_file, embeddings=None, max_columns=3)
+
+    tables = catalog.select("Average discount per supplier in the inventory")
+    info = catalog.table_info(tables)  # what SQLDatabaseChain asks for: table names only
+
+    assert tables[0] == "inventory"
+    header = info.splitlines()[0]
+    assert header == "inventory(id INTEGER PK, supplier TEXT, discount TEXT)"
+    assert "barcode" not in info
+    # sample rows are cut down to the same columns
+    assert info.splitlines()[1] == "  e.g. (1, 'v3', 'v4')"
+
+
+def test_narrow_tables_keep_all_columns(db_file):
+    catalog = SchemaCatalog(db_file, embeddings=None, max_columns=3)
+
+    catalog.select("customers per region")
+
+    assert catalog.table_info(["customers"]).startswith("customers(id INTEGER PK, name TEXT, region TEXT)")
+
+
+def test_select_adds_join_neighbours_without_a_match(orders_db):
+    catalog = SchemaCatalog(orders_db, embeddings=None)
+
+    tables = catalog.select("Revenue by region")
+
+    # region only matches customers; the amounts to sum are in orders
+    assert tables[0] == "customers"
+    assert "orders" in tables
+
+
+def test_select_falls_back_to_every_table_when_nothing_matches(orders_db):
+    catalog = SchemaCatalog(orders_db, embeddings=None)
+
+    assert sorted(catalog.select("Who spent the most money?")) == ["customers", "orders", "products"]
+
+
+def test_unknown_table_raises_value_error_like_sqldatabase(orders_db):
+    catalog = SchemaCatalog(orders_db, embeddings=None)
+    db = CatalogSQLDatabase.from_uri(f"sqlite:///{orders_db}", catalog=catalog)
+
+    with pytest.raises(ValueError, match="returns"):
+        db.get_table_info(["orders", "returns"])
+    db._engine.dispose()